@@ -2,27 +2,363 @@
 """
 EBRD Job Scraper
 Extracts job listings from EBRD careers website and generates RSS feed
-Uses Selenium to handle JavaScript-rendered content
+Fetches the search results pages directly over HTTP; falls back to
+Selenium if the HTTP endpoint misbehaves
 """
 
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from datetime import datetime
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-import time
+import lxml.html
+from collections import namedtuple
+from datetime import datetime, timezone
+from lxml import etree as ET
+import asyncio
+import hashlib
+import json
+import os
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 BASE_URL = "https://jobs.ebrd.com"
 SEARCH_URL = f"{BASE_URL}/search/?q=&sortColumn=referencedate&sortDirection=desc"
 
+OUTPUT_FILE = 'ebrd_jobs.xml'
+
+PAGE_SIZE = 25  # rows per page on the SuccessFactors search endpoint
+MAX_PAGES = 40  # safety cap so a parsing regression can't loop forever
+
+DETAIL_CONCURRENCY = 20  # max in-flight detail page requests
+
+# Selenium fallback: what to wait for, and how long
+JOB_ROWS_SELECTOR = (By.CSS_SELECTOR, "table.searchResults tr.data-row a")
+WAIT_TIMEOUT = 20
+
+# One listing; a namedtuple is a third the size of the dict per row
+Job = namedtuple('Job', ['title', 'link', 'location', 'posting_date',
+                         'description'], defaults=[None])
+
+USER_AGENT = ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0 Safari/537.36')
+
+# Endpoint of an externally managed chromedriver (e.g. a sidecar running
+# `chromedriver --port=9515`). Sessions are only persisted and reused when
+# this is set: a chromedriver launched by the in-process Service is stopped
+# when the interpreter exits, so its executor URL would always be dead by
+# the next run.
+CHROMEDRIVER_URL = os.environ.get('EBRD_CHROMEDRIVER_URL')
+
+# Where we remember the running ChromeDriver session between invocations
+SESSION_FILE = '.chromedriver_session.json'
+
+# Where we remember the last response's cache validators between invocations
+CACHE_FILE = '.ebrd_cache.json'
+
+def _load_cache():
+    """Read the cache file, returning an empty dict if missing or corrupt"""
+    try:
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Warning: could not save cache: {e}")
+
+# Resources the scrape never needs: analytics, fonts, and image files
+BLOCKED_URL_PATTERNS = [
+    '*google-analytics*',
+    '*googletagmanager*',
+    '*doubleclick*',
+    '*fonts.googleapis*',
+    '*.woff',
+    '*.woff2',
+    '*.png',
+    '*.jpg',
+    '*.jpeg',
+    '*.svg',
+    '*.gif',
+]
+
+# Resolve the chromedriver binary once per process, not per setup_driver call
+_chromedriver_path = None
+
+def _chromedriver_binary():
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+class ReusableRemote(webdriver.Remote):
+    """Remote driver that attaches to an existing session instead of creating one"""
+
+    def start_session(self, capabilities=None, browser_profile=None):
+        # No-op: the caller assigns session_id from the saved session
+        self.caps = {}
+
+def _save_session(driver):
+    """Persist the driver's session so the next run can re-attach to it"""
+    try:
+        with open(SESSION_FILE, 'w', encoding='utf-8') as f:
+            json.dump({
+                # Sessions are only persisted against the external endpoint,
+                # so record the configured URL rather than digging it out of
+                # RemoteConnection internals that shift between versions
+                'executor_url': CHROMEDRIVER_URL,
+                'session_id': driver.session_id
+            }, f)
+    except OSError as e:
+        print(f"Warning: could not save browser session: {e}")
+
+def _attach_driver():
+    """Re-attach to a previously saved ChromeDriver session, if still alive"""
+    if not CHROMEDRIVER_URL or not os.path.exists(SESSION_FILE):
+        return None
+
+    try:
+        with open(SESSION_FILE, encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # Anything going wrong here — a dead session, an unreachable executor,
+    # a stale or truncated session file, a Selenium API change — just means
+    # a fresh launch, so no exception may escape (an unreachable endpoint
+    # surfaces as urllib3 errors, not WebDriverException)
+    try:
+        driver = ReusableRemote(command_executor=saved['executor_url'],
+                                options=Options(), keep_alive=True)
+        driver.session_id = saved['session_id']
+        driver.current_url  # probe that the session is still alive
+        return driver
+    except Exception:
+        return None
+
+class _RowCollector:
+    """lxml parser target that collects data-row fields without building a DOM
+
+    Only the text fragments inside each <tr class="data-row"> are buffered;
+    everything else in the document is discarded as it streams through the
+    parser, so the full page is never materialized as Python objects.
+    """
+
+    def __init__(self, seen_links):
+        self.seen_links = seen_links
+        self.jobs = []
+        self.rows_seen = 0        # data-rows parsed, including duplicates
+        self._in_row = False
+        self._cells = []          # one text-fragment list per <td>
+        self._href = None         # href of the first link in the row
+        self._title_parts = []    # text fragments of the title link
+        self._in_link = False
+
+    def start(self, tag, attrib):
+        if tag == 'tr' and 'data-row' in (attrib.get('class') or ''):
+            self._in_row = True
+            self._cells = []
+            self._href = None
+            self._title_parts = []
+        elif self._in_row:
+            if tag == 'td':
+                self._cells.append([])
+            elif tag == 'a' and self._href is None:
+                self._href = attrib.get('href') or ''
+                self._in_link = True
+
+    def data(self, text):
+        if not self._in_row:
+            return
+        if self._in_link:
+            self._title_parts.append(text)
+        if self._cells:
+            self._cells[-1].append(text)
+
+    def end(self, tag):
+        if not self._in_row:
+            return
+        if tag == 'a':
+            self._in_link = False
+        elif tag == 'tr':
+            self.rows_seen += 1
+            self._emit_row()
+            self._in_row = False
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        result = (self.jobs, self.rows_seen)
+        self.jobs = []
+        self.rows_seen = 0
+        return result
+
+    def _emit_row(self):
+        title = ''.join(self._title_parts).strip()
+        job_url = self._href or ''
+
+        # Skip if we don't have essential info
+        if not title or not job_url:
+            return
+
+        # Make URL absolute
+        if job_url.startswith('/'):
+            job_url = BASE_URL + job_url
+        elif not job_url.startswith('http'):
+            job_url = BASE_URL + '/' + job_url
+
+        # Skip duplicates (by link)
+        if job_url in self.seen_links:
+            return
+        self.seen_links.add(job_url)
+
+        # Extract location and date (if available)
+        cells = [''.join(parts).strip() for parts in self._cells]
+        location = cells[1] if len(cells) >= 2 and cells[1] else 'Not specified'
+        posting_date = cells[2] if len(cells) >= 3 and cells[2] else 'Not specified'
+
+        self.jobs.append(Job(title, job_url, location, posting_date))
+
+def parse_job_rows(html_content, seen_links):
+    """Parse job rows out of a search results page
+
+    Returns (jobs, row_count): jobs is a list of Job tuples, row_count the
+    number of data-rows on the page before deduplication — pagination must
+    be judged on that, since overlapping pages can dedup away rows. Rows whose link is
+    already in seen_links are skipped; new links are added to the set, so
+    duplicates are dropped as they are parsed. The page is streamed
+    through a target parser, never held as a full tree.
+    """
+    parser = ET.HTMLParser(target=_RowCollector(seen_links))
+    return ET.fromstring(html_content.encode('utf-8'), parser)
+
+def fetch_jobs_http():
+    """Fetch all job listings directly over HTTP (no browser needed)
+
+    Returns None (without fetching the remaining pages) when the server
+    reports the listings unchanged since the last run.
+    """
+    print("Fetching job listings over HTTP...")
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+
+    cache = _load_cache()
+
+    all_jobs = []
+    seen_links = set()
+
+    for page in range(MAX_PAGES):
+        startrow = page * PAGE_SIZE
+
+        # Send cache validators with the first page so an unchanged feed
+        # costs a single 304 round trip
+        headers = {}
+        if page == 0:
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+
+        response = session.get(SEARCH_URL, params={'startrow': startrow},
+                               headers=headers, timeout=30)
+
+        if page == 0 and response.status_code == 304:
+            print("[OK] Listings unchanged since last run (HTTP 304)")
+            if cache.get('jobs') and not os.path.exists(OUTPUT_FILE):
+                print("Feed file is missing, rebuilding it from cached jobs")
+                return [Job(**d) for d in cache['jobs']]
+            return None
+
+        response.raise_for_status()
+
+        if page == 0:
+            cache['etag'] = response.headers.get('ETag')
+            cache['last_modified'] = response.headers.get('Last-Modified')
+
+            # Even without usable validators, an unchanged first page means
+            # an unchanged job list: reuse the cached parse wholesale
+            page_hash = hashlib.sha256(response.text.encode('utf-8')).hexdigest()
+            if page_hash == cache.get('hash') and cache.get('jobs'):
+                print("[OK] Page content unchanged, reusing cached job list")
+                _save_cache(cache)
+                return [Job(**d) for d in cache['jobs']]
+            cache['hash'] = page_hash
+
+        jobs, row_count = parse_job_rows(response.text, seen_links)
+        if not row_count:
+            break
+
+        print(f"[OK] Page {page + 1}: found {len(jobs)} jobs")
+        all_jobs.extend(jobs)
+
+        if row_count < PAGE_SIZE:
+            break  # last page
+
+    cache['jobs'] = [job._asdict() for job in all_jobs]
+    _save_cache(cache)
+
+    return all_jobs
+
+def _parse_job_description(html_content):
+    """Pull the description text out of a job detail page"""
+    tree = lxml.html.fromstring(html_content)
+    for xpath in ('//span[@itemprop="description"]',
+                  '//div[contains(@class, "jobdescription")]',
+                  '//meta[@name="description"]/@content'):
+        found = tree.xpath(xpath)
+        if found:
+            node = found[0]
+            text = node if isinstance(node, str) else node.text_content()
+            if text.strip():
+                return text.strip()
+    return None
+
+async def _fetch_detail(session, job):
+    """Fetch one job's detail page and return its description text"""
+    try:
+        async with session.get(job.link) as response:
+            response.raise_for_status()
+            html_content = await response.text()
+        return _parse_job_description(html_content)
+    except Exception as e:
+        # One broken detail page shouldn't take down the whole run
+        print(f"Warning: could not fetch details for {job.link}: {e}")
+        return None
+
+async def _enrich_jobs(jobs):
+    connector = aiohttp.TCPConnector(limit=DETAIL_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     headers={'User-Agent': USER_AGENT}) as session:
+        descriptions = await asyncio.gather(
+            *(_fetch_detail(session, job) for job in jobs))
+    return [job._replace(description=desc) if desc else job
+            for job, desc in zip(jobs, descriptions)]
+
+def enrich_jobs(jobs):
+    """Fetch all job detail pages concurrently and attach descriptions"""
+    print(f"Fetching details for {len(jobs)} jobs...")
+    return asyncio.run(_enrich_jobs(jobs))
+
 def setup_driver():
-    """Setup Chrome WebDriver with headless mode"""
+    """Setup Chrome WebDriver with headless mode, reusing a live session if possible"""
+    driver = _attach_driver()
+    if driver is not None:
+        print("[OK] Re-attached to existing browser session")
+        return driver
+
     chrome_options = Options()
     chrome_options.add_argument('--headless')
     chrome_options.add_argument('--no-sandbox')
@@ -30,8 +366,42 @@ def setup_driver():
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    # The job table is plain HTML; skip everything the scrape doesn't need
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-plugins')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-sync')
+    chrome_options.add_argument('--disable-translate')
+    chrome_options.add_argument('--log-level=3')
+    chrome_options.add_experimental_option(
+        'prefs', {'profile.managed_default_content_settings.images': 2})
+
+    # Return from driver.get on DOMContentLoaded; the explicit wait handles
+    # anything rendered after that
+    chrome_options.page_load_strategy = 'eager'
+
+    if CHROMEDRIVER_URL:
+        driver = webdriver.Remote(command_executor=CHROMEDRIVER_URL,
+                                  options=chrome_options, keep_alive=True)
+    else:
+        service = Service(_chromedriver_binary())
+        driver = webdriver.Chrome(service=service, options=chrome_options,
+                                  keep_alive=True)
+
+    # Block non-essential resources at the network layer. CDP settings stick
+    # to the browser session, so this only needs to run on a fresh launch;
+    # plain Remote drivers don't expose execute_cdp_cmd.
+    if hasattr(driver, 'execute_cdp_cmd'):
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs',
+                                   {'urls': BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            print(f"Warning: could not set up request blocking: {e}")
+
+    if CHROMEDRIVER_URL:
+        _save_session(driver)
     return driver
 
 def fetch_jobs_with_selenium():
@@ -39,113 +409,84 @@ def fetch_jobs_with_selenium():
     print("Starting Chrome browser (headless mode)...")
     driver = setup_driver()
     all_jobs = []
+    seen_links = set()
 
     try:
         print(f"Loading EBRD jobs page...")
         driver.get(SEARCH_URL)
 
-        # Wait for the page to load
-        print("Waiting for page content to load...")
-        time.sleep(5)  # Give JavaScript time to render
-
-        # Wait for job listings to appear
+        # Wait for actual job rows to render, not just the empty table shell
+        print("Waiting for job listings to load...")
         try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "searchResults"))
+            WebDriverWait(driver, WAIT_TIMEOUT).until(
+                EC.presence_of_all_elements_located(JOB_ROWS_SELECTOR)
             )
-            print("[OK] Job listings table found")
+            print("[OK] Job listings found")
         except Exception as e:
-            print(f"Warning: Timeout waiting for job listings table: {e}")
-
-        # Get the page HTML
-        html_content = driver.page_source
-
-        # Save debug HTML
-        with open('debug_page.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print("[OK] Saved debug HTML to debug_page.html")
-
-        # Parse the HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Find the job listings table (searchResults class)
-        table = soup.find('table', {'class': 'searchResults'})
-
-        if not table:
-            print("ERROR: Could not find job listings table")
-            # Try to find any table
-            all_tables = soup.find_all('table')
-            print(f"Found {len(all_tables)} table(s) total")
-            if all_tables:
-                print("Table classes found:", [t.get('class') for t in all_tables])
-            return []
-
-        print("[OK] Job table found, parsing jobs...")
-
-        # Find all job rows
-        rows = table.find_all('tr', {'class': 'data-row'})
-
-        if not rows:
-            # Try alternative selectors
-            rows = table.find_all('tr')
-            rows = [r for r in rows if r.find('a')]  # Keep only rows with links
-
-        print(f"Found {len(rows)} job rows")
-
-        for row in rows:
-            try:
-                # Find the job title link
-                link = row.find('a')
-                if not link:
-                    continue
-
-                title = link.get_text(strip=True)
-                job_url = link.get('href', '')
-
-                # Make URL absolute
-                if job_url.startswith('/'):
-                    job_url = BASE_URL + job_url
-                elif not job_url.startswith('http'):
-                    job_url = BASE_URL + '/' + job_url
-
-                # Find all cells in the row
-                cells = row.find_all('td')
-
-                # Extract location and date (if available)
-                location = 'Not specified'
-                posting_date = 'Not specified'
-
-                if len(cells) >= 2:
-                    location = cells[1].get_text(strip=True) if cells[1] else 'Not specified'
-                if len(cells) >= 3:
-                    posting_date = cells[2].get_text(strip=True) if cells[2] else 'Not specified'
-
-                # Skip if we don't have essential info
-                if not title or not job_url or title == '':
-                    continue
-
-                all_jobs.append({
-                    'title': title,
-                    'link': job_url,
-                    'location': location,
-                    'posting_date': posting_date
-                })
-
-            except Exception as e:
-                print(f"Error parsing job row: {e}")
+            print(f"Warning: Timeout waiting for job listings: {e}")
+
+        # Save debug HTML (opt-in: page_source ships the whole DOM over the
+        # wire and the dump can run to a few MB per run)
+        if os.environ.get('EBRD_DEBUG'):
+            with open('debug_page.html', 'w', encoding='utf-8') as f:
+                f.write(driver.page_source)
+            print("[OK] Saved debug HTML to debug_page.html")
+
+        # Extract the rows in-page in one round trip instead of shipping the
+        # whole DOM over the wire as page_source and re-parsing it in Python
+        raw_rows = driver.execute_script("""
+            return Array.from(
+                document.querySelectorAll('table.searchResults tr.data-row')
+            ).map(function (row) {
+                var a = row.querySelector('a');
+                var td = row.querySelectorAll('td');
+                return {
+                    title: a ? a.innerText.trim() : '',
+                    link: a ? a.href : '',
+                    location: td.length > 1 ? td[1].innerText.trim() : '',
+                    posting_date: td.length > 2 ? td[2].innerText.trim() : ''
+                };
+            });
+        """)
+
+        for raw in raw_rows:
+            # Skip if we don't have essential info
+            if not raw['title'] or not raw['link']:
+                continue
+            # Skip duplicates (by link)
+            if raw['link'] in seen_links:
                 continue
+            seen_links.add(raw['link'])
+            all_jobs.append(Job(raw['title'], raw['link'],
+                                raw['location'] or 'Not specified',
+                                raw['posting_date'] or 'Not specified'))
+
+        if not all_jobs:
+            print("ERROR: Could not find any job rows")
+        else:
+            print(f"Found {len(all_jobs)} job rows")
 
     finally:
-        driver.quit()
-        print("[OK] Browser closed")
+        if CHROMEDRIVER_URL:
+            # Leave the session alive on the external chromedriver so the
+            # next run can re-attach; a dead session is detected by the
+            # probe in _attach_driver and replaced
+            print("[OK] Leaving browser session alive for reuse")
+        else:
+            driver.quit()
+            print("[OK] Browser closed")
 
     return all_jobs
 
 def create_rss_feed(jobs):
     """Generate RSS 2.0 feed from job listings"""
 
+    # One timestamp for the whole build: lastBuildDate and every pubDate
+    now_str = datetime.now(timezone.utc).strftime('%a, %d %b %Y %H:%M:%S GMT')
+
     # Create RSS root
-    rss = ET.Element('rss', version='2.0', attrib={'xmlns:atom': 'http://www.w3.org/2005/Atom'})
+    atom_ns = 'http://www.w3.org/2005/Atom'
+    rss = ET.Element('rss', version='2.0', nsmap={'atom': atom_ns})
 
     # Create channel
     channel = ET.SubElement(rss, 'channel')
@@ -155,10 +496,10 @@ def create_rss_feed(jobs):
     ET.SubElement(channel, 'link').text = SEARCH_URL
     ET.SubElement(channel, 'description').text = 'Current job opportunities at the European Bank for Reconstruction and Development'
     ET.SubElement(channel, 'language').text = 'en'
-    ET.SubElement(channel, 'lastBuildDate').text = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
+    ET.SubElement(channel, 'lastBuildDate').text = now_str
 
     # Add atom:link for feed validation
-    atom_link = ET.SubElement(channel, 'atom:link')
+    atom_link = ET.SubElement(channel, f'{{{atom_ns}}}link')
     atom_link.set('href', 'https://cinfoposte.github.io/ebrd-jobs/ebrd_jobs.xml')
     atom_link.set('rel', 'self')
     atom_link.set('type', 'application/rss+xml')
@@ -168,70 +509,74 @@ def create_rss_feed(jobs):
         item = ET.SubElement(channel, 'item')
 
         # Title
-        ET.SubElement(item, 'title').text = job['title']
+        ET.SubElement(item, 'title').text = job.title
 
         # Link
-        ET.SubElement(item, 'link').text = job['link']
+        ET.SubElement(item, 'link').text = job.link
 
-        # Description with location and posting date
-        description = f"Location: {job['location']}\nPosting Date: {job['posting_date']}"
+        # Description with location and posting date, plus the job's own
+        # description when the detail pages were fetched
+        description = f"Location: {job.location}\nPosting Date: {job.posting_date}"
+        if job.description:
+            description += '\n\n' + job.description
         ET.SubElement(item, 'description').text = description
 
         # Publication date (use current date as fallback)
-        ET.SubElement(item, 'pubDate').text = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
+        ET.SubElement(item, 'pubDate').text = now_str
 
         # GUID (use job URL)
         guid = ET.SubElement(item, 'guid')
         guid.set('isPermaLink', 'true')
-        guid.text = job['link']
+        guid.text = job.link
 
     return rss
 
-def prettify_xml(element):
-    """Return a pretty-printed XML string"""
-    rough_string = ET.tostring(element, encoding='utf-8')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent='  ', encoding='utf-8').decode('utf-8')
-
 def main():
     """Main scraper function"""
     print("=" * 60)
     print("EBRD Job Scraper")
     print("=" * 60)
 
-    # Fetch all jobs
-    jobs = fetch_jobs_with_selenium()
+    # Fetch all jobs (plain HTTP first, Selenium as a fallback)
+    try:
+        jobs = fetch_jobs_http()
+    except requests.RequestException as e:
+        print(f"HTTP fetch failed ({e}), falling back to Selenium...")
+        jobs = fetch_jobs_with_selenium()
+
+    if jobs is None:
+        print("\nFeed is up to date, nothing to do.")
+        return
 
     if not jobs:
         print("No jobs found!")
         return
 
-    # Remove duplicates (by link)
-    unique_jobs = []
-    seen_links = set()
-    for job in jobs:
-        if job['link'] not in seen_links:
-            unique_jobs.append(job)
-            seen_links.add(job['link'])
+    # Duplicates are already dropped inside the fetch loops
+    print(f"\nUnique jobs: {len(jobs)}")
 
-    print(f"\nUnique jobs: {len(unique_jobs)}")
+    # Optionally pull each job's description page (N extra requests, so opt-in)
+    if os.environ.get('EBRD_FETCH_DETAILS'):
+        if aiohttp is None:
+            print("Warning: aiohttp not installed, skipping detail fetch")
+        else:
+            jobs = enrich_jobs(jobs)
 
     # Create RSS feed
     print("\nGenerating RSS feed...")
-    rss_feed = create_rss_feed(unique_jobs)
-
-    # Save to file
-    output_file = 'ebrd_jobs.xml'
-    xml_content = prettify_xml(rss_feed)
+    rss_feed = create_rss_feed(jobs)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(xml_content)
+    # Serialize straight to disk rather than via an intermediate string
+    output_file = OUTPUT_FILE
+    with open(output_file, 'wb') as f:
+        rss_feed.getroottree().write(f, pretty_print=True,
+                                     xml_declaration=True, encoding='utf-8')
 
     print(f"\n[SUCCESS] RSS feed saved to: {output_file}")
-    print(f"[SUCCESS] Total jobs in feed: {len(unique_jobs)}")
+    print(f"[SUCCESS] Total jobs in feed: {len(jobs)}")
     print("\nSample jobs:")
-    for i, job in enumerate(unique_jobs[:5], 1):
-        print(f"{i}. {job['title']} - {job['location']}")
+    for i, job in enumerate(jobs[:5], 1):
+        print(f"{i}. {job.title} - {job.location}")
 
     print("\n" + "=" * 60)
     print("Done!")